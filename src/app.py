@@ -1,16 +1,19 @@
-from flask import Flask, jsonify
 from http import HTTPStatus
 from typing import Dict, Any
 
-def create_app(test_config: Dict[str, Any] | None = None) -> Flask:
+def create_app(test_config: Dict[str, Any] | None = None):
     """Create and configure the Flask application.
-    
+
     Args:
         test_config: Configuration dictionary for testing purposes.
-        
+
     Returns:
         Configured Flask application instance.
     """
+    # Imported here so analyzer/generator-only entry points don't pay
+    # the Flask import cost at startup.
+    from flask import Flask, jsonify
+
     app = Flask(__name__)
 
     # Load default configuration
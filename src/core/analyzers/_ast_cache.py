@@ -0,0 +1,44 @@
+"""On-disk cache of analysis results keyed by source SHA-256."""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Optional
+
+from src.core.models.code_elements import AnalysisResult
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "autogen-tests" / "ast"
+
+class AnalysisDiskCache:
+    """Persists pickled AnalysisResult objects so repeated process runs
+    skip re-parsing sources that have already been analyzed."""
+
+    def __init__(self, cache_dir: Optional[os.PathLike] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(code: str) -> str:
+        """Return the cache key (content hash) for a source string."""
+        return hashlib.sha256(code.encode()).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, code: str) -> Optional[AnalysisResult]:
+        """Return the cached result for this source, or None on a miss."""
+        path = self._path_for(self.key_for(code))
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def put(self, code: str, result: AnalysisResult) -> None:
+        """Store an analysis result; failures to write are non-fatal."""
+        path = self._path_for(self.key_for(code))
+        try:
+            with open(path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
@@ -0,0 +1,60 @@
+"""Flattened struct-of-arrays view over an AST for bulk kind queries."""
+import ast
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Stable small ids for the node kinds bulk queries care about; anything
+# else maps to OTHER.
+OTHER = 0
+FUNCTION_DEF = 1
+ASYNC_FUNCTION_DEF = 2
+CLASS_DEF = 3
+IMPORT = 4
+IMPORT_FROM = 5
+
+_KIND_IDS = {
+    ast.FunctionDef: FUNCTION_DEF,
+    ast.AsyncFunctionDef: ASYNC_FUNCTION_DEF,
+    ast.ClassDef: CLASS_DEF,
+    ast.Import: IMPORT,
+    ast.ImportFrom: IMPORT_FROM,
+}
+
+def flatten(tree: ast.AST) -> Tuple[object, object, List[ast.AST]]:
+    """Flatten a tree into (kinds, parents, nodes) parallel columns.
+
+    One DFS pass builds an int32 kind array, an int32 parent-index array
+    (-1 for the root) and the node list in the same order. With numpy
+    installed, kind filtering over the arrays is a single vectorized
+    mask instead of an isinstance branch per node; without it, plain
+    lists are returned and node_indices falls back to a scan.
+    """
+    kinds: List[int] = []
+    parents: List[int] = []
+    nodes: List[ast.AST] = []
+
+    stack = [(tree, -1)]
+    while stack:
+        node, parent_index = stack.pop()
+        index = len(nodes)
+        nodes.append(node)
+        kinds.append(_KIND_IDS.get(type(node), OTHER))
+        parents.append(parent_index)
+        for child in ast.iter_child_nodes(node):
+            stack.append((child, index))
+
+    if np is not None:
+        return (np.asarray(kinds, dtype=np.int32),
+                np.asarray(parents, dtype=np.int32),
+                nodes)
+    return kinds, parents, nodes
+
+def node_indices(kinds, kind_id: int) -> List[int]:
+    """Return the indices whose kind matches, vectorized when possible."""
+    if np is not None and isinstance(kinds, np.ndarray):
+        return np.nonzero(kinds == kind_id)[0].tolist()
+    return [i for i, kind in enumerate(kinds) if kind == kind_id]
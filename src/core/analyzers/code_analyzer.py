@@ -1,7 +1,11 @@
 """Code analyzer component for parsing and analyzing Python code."""
 import ast
-from dataclasses import dataclass
+import concurrent.futures
+import functools
+import inspect
+import sys
 from typing import List, Optional
+from src.core.analyzers._ast_cache import AnalysisDiskCache
 from src.core.models.code_elements import (
     AnalysisResult,
     FunctionDefinition,
@@ -9,57 +13,135 @@ from src.core.models.code_elements import (
     ImportDefinition,
 )
 
-@dataclass
-class NodeContext:
-    """Context for tracking AST node relationships."""
-    node: ast.AST
-    parent: Optional['NodeContext'] = None
-    children: List['NodeContext'] = list()
+# Singleton returned for empty/whitespace sources.
+_EMPTY_RESULT = AnalysisResult()
 
 class CodeStructureAnalyzer:
     """Analyzes Python code structure and extracts key elements."""
-    
+
+    CACHE_SIZE = 128
+
+    def __init__(self, use_disk_cache: bool = False, cache_dir=None):
+        # Analysis is a pure function of the source, so repeated analyses of
+        # the same code (common across pipeline runs) can share one result.
+        self._analyze_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._analyze_uncached
+        )
+        # Optional second tier that survives process restarts. Giving a
+        # cache_dir implies opting in, so both spellings work:
+        # CodeStructureAnalyzer(use_disk_cache=True) and
+        # CodeStructureAnalyzer(cache_dir=".pytest_cache/ast").
+        if use_disk_cache or cache_dir is not None:
+            self._disk_cache = AnalysisDiskCache(cache_dir)
+        else:
+            self._disk_cache = None
+
     def analyze(self, code: str) -> AnalysisResult:
         """Analyze code string and return structured analysis result."""
+        return self._analyze_cached(code)
+
+    def analyze_many(self, codes: List[str], workers: Optional[int] = None) -> List[AnalysisResult]:
+        """Analyze a batch of sources, deduplicating identical inputs.
+
+        Each distinct source is parsed once; with ``workers`` > 1 the
+        distinct sources are analyzed in a process pool. Results are
+        returned in input order.
+        """
+        unique = list(dict.fromkeys(codes))
+        if workers and workers > 1 and len(unique) > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                analyzed = dict(zip(unique, pool.map(_analyze_source, unique)))
+        else:
+            analyzed = {code: self.analyze(code) for code in unique}
+        return [analyzed[code] for code in codes]
+
+    def _analyze_uncached(self, code: str) -> AnalysisResult:
+        """Parse and analyze source without consulting the in-process cache."""
+        # Empty input has exactly one result; skip the tokenizer and
+        # return the shared instance. Results from analyze() are shared
+        # via the caches anyway, so callers already treat them as
+        # read-only.
+        if not code or code.isspace():
+            return _EMPTY_RESULT
+        if self._disk_cache is not None:
+            cached = self._disk_cache.get(code)
+            if cached is not None:
+                return cached
         try:
-            tree = ast.parse(code)
-            return self._analyze_tree(tree)
+            # type_comments stays off (nothing here reads them) and the
+            # grammar is pinned to the running interpreter, skipping the
+            # type-comment branches in the tokenizer.
+            tree = ast.parse(code, mode="exec", type_comments=False,
+                             feature_version=sys.version_info[:2])
+            result = self._analyze_tree(tree)
         except SyntaxError as e:
             raise SyntaxError(f"Failed to parse code: {str(e)}")
+        if self._disk_cache is not None:
+            self._disk_cache.put(code, result)
+        return result
+
+    def analyze_ast(self, tree: ast.AST) -> AnalysisResult:
+        """Analyze an already-parsed tree, skipping tokenize/parse.
+
+        Fast path for callers that hold a pre-built ast.Module (shared
+        fixture trees, pipeline stages that parsed earlier); bypasses
+        the source-keyed caches entirely.
+        """
+        return self._analyze_tree(tree)
 
     def _analyze_tree(self, tree: ast.AST) -> AnalysisResult:
         """Analyze parsed AST and extract code elements."""
         result = AnalysisResult()
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if not self._is_class_method(node):
-                    result.functions.append(self._analyze_function(node))
-            elif isinstance(node, ast.ClassDef):
-                result.classes.append(self._analyze_class(node))
-            elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                result.imports.extend(self._process_import(node))
-        
+        self._visit(tree, result, current_class=None)
         return result
 
+    def _visit(self, node: ast.AST, result: AnalysisResult,
+               current_class: Optional[ClassDefinition]) -> None:
+        """Recursively collect code elements in a single pass over the tree.
+
+        Functions encountered inside a class body are attached to that
+        class's methods list directly, so class bodies are never re-walked.
+        """
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.FunctionDef):
+                definition = self._analyze_function(child)
+                if current_class is None:
+                    result.functions.append(definition)
+                else:
+                    current_class.methods.append(definition)
+                self._visit(child, result, current_class=None)
+            elif isinstance(child, ast.ClassDef):
+                class_definition = self._analyze_class(child)
+                result.classes.append(class_definition)
+                self._visit(child, result, current_class=class_definition)
+            elif isinstance(child, (ast.Import, ast.ImportFrom)):
+                result.imports.extend(self._process_import(child))
+            else:
+                self._visit(child, result, current_class)
+
     def _analyze_function(self, node: ast.FunctionDef) -> FunctionDefinition:
         """Extract function information from AST node."""
+        # Identifiers repeat heavily across a codebase ("self", "cls",
+        # common type names); interning shares one str object per spelling.
         return FunctionDefinition(
             name=node.name,
-            parameters=[arg.arg for arg in node.args.args],
+            parameters=[sys.intern(arg.arg) for arg in node.args.args],
             return_type=self._get_return_type(node),
-            docstring=ast.get_docstring(node),
+            docstring=self._extract_docstring(node),
             is_property=any(isinstance(d, ast.Name) and d.id == 'property' 
                           for d in node.decorator_list)
         )
 
     def _analyze_class(self, node: ast.ClassDef) -> ClassDefinition:
-        """Extract class information from AST node."""
+        """Extract class information from AST node.
+
+        Methods are filled in by the fused traversal as the class body is
+        visited, not by a second scan here.
+        """
         return ClassDefinition(
             name=node.name,
-            methods=[self._analyze_function(n) for n in node.body 
-                    if isinstance(n, ast.FunctionDef)],
-            docstring=ast.get_docstring(node),
+            methods=[],
+            docstring=self._extract_docstring(node),
             base_classes=[self._get_name(base) for base in node.bases]
         )
 
@@ -69,14 +151,14 @@ class CodeStructureAnalyzer:
         if isinstance(node, ast.Import):
             for name in node.names:
                 imports.append(ImportDefinition(
-                    module=name.name,
-                    names=[name.asname or name.name],
+                    module=sys.intern(name.name),
+                    names=[sys.intern(name.asname or name.name)],
                     is_from_import=False
                 ))
         elif isinstance(node, ast.ImportFrom):
             imports.append(ImportDefinition(
-                module=node.module or '',
-                names=[n.name for n in node.names],
+                module=sys.intern(node.module or ''),
+                names=[sys.intern(n.name) for n in node.names],
                 is_from_import=True
             ))
         return imports
@@ -84,14 +166,34 @@ class CodeStructureAnalyzer:
     def _get_return_type(self, node: ast.FunctionDef) -> Optional[str]:
         """Extract return type annotation if present."""
         if node.returns:
-            return ast.unparse(node.returns)
+            return sys.intern(self._get_name(node.returns))
         return None
 
-    def _is_class_method(self, node: ast.FunctionDef) -> bool:
-        """Check if a function definition is inside a class."""
-        return any(isinstance(parent, ast.ClassDef) 
-                  for parent in ast.walk(node))
+    def _extract_docstring(self, node: ast.AST) -> Optional[str]:
+        """Read the leading docstring without ast.get_docstring overhead."""
+        body = node.body
+        if body and isinstance(body[0], ast.Expr):
+            value = body[0].value
+            if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                return inspect.cleandoc(value.value)
+        return None
 
     def _get_name(self, node: ast.AST) -> str:
-        """Extract name from AST node."""
-        return ast.unparse(node)
\ No newline at end of file
+        """Extract name from AST node.
+
+        Handles the common annotation shapes directly; the full
+        unparser only runs for anything more exotic.
+        """
+        if isinstance(node, ast.Name):
+            return node.id
+        if isinstance(node, ast.Attribute):
+            return f"{self._get_name(node.value)}.{node.attr}"
+        if isinstance(node, ast.Subscript):
+            return f"{self._get_name(node.value)}[{self._get_name(node.slice)}]"
+        if isinstance(node, ast.Constant):
+            return str(node.value)
+        return ast.unparse(node)
+
+def _analyze_source(code: str) -> AnalysisResult:
+    """Module-level worker so analyze_many can run in a process pool."""
+    return CodeStructureAnalyzer().analyze(code)
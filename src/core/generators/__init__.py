@@ -1,5 +1,14 @@
 """Generators package for test generation components."""
-from .template_engine import TemplateEngine
-from .test_generator import TestGenerator
 
-__all__ = ['TemplateEngine', 'TestGenerator']
\ No newline at end of file
+__all__ = ['TemplateEngine', 'TestGenerator']
+
+def __getattr__(name):
+    # PEP 562: defer importing the generator modules until first use so
+    # importing the package stays cheap for analyzer-only code paths.
+    if name == 'TemplateEngine':
+        from .template_engine import TemplateEngine
+        return TemplateEngine
+    if name == 'TestGenerator':
+        from .test_generator import TestGenerator
+        return TestGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,50 @@
 """Template engine for generating test code."""
+import functools
+import io
+import string
 from typing import List
 from src.core.models.code_elements import TestCase
 
+# Compiled once at import; substitution is a single C-level pass instead
+# of per-call f-string assembly.
+_TEST_FUNCTION_TEMPLATE = string.Template(
+    "def $test_name():\n$docstring\n    $body"
+)
+
+@functools.lru_cache(maxsize=1024)
+def _render_test_function(test_name: str, body: str, docstring: str) -> str:
+    """Render one test function; memoized since generated test cases
+    frequently repeat the same (name, body, docstring) shape."""
+    doc_line = f'    """{docstring}"""' if docstring else ""
+    return _TEST_FUNCTION_TEMPLATE.substitute(
+        test_name=test_name, docstring=doc_line, body=body
+    )
+
 class TemplateEngine:
     def render(self, test_case: TestCase) -> str:
         """Render a single test case to code."""
         return self._generate_test_function(test_case)
 
     def render_test_module(self, test_cases: List[TestCase]) -> str:
-        """Render multiple test cases as a test module."""
-        imports = "import pytest\n\n"
-        test_functions = "\n\n".join(self._generate_test_function(tc) for tc in test_cases)
-        return f"{imports}{test_functions}"
+        """Render multiple test cases as a test module.
+
+        Writes straight into one growing buffer so no per-test-case
+        intermediate strings are held alongside the final module text.
+        """
+        buf = io.StringIO()
+        buf.write("import pytest\n\n")
+        for i, test_case in enumerate(test_cases):
+            if i:
+                buf.write("\n\n")
+            self._write_test_function(buf, test_case)
+        return buf.getvalue()
 
     def _generate_test_function(self, test_case: TestCase) -> str:
         """Generate a test function from a test case."""
-        docstring = f'    """{test_case.docstring}"""' if test_case.docstring else ""
-        return (
-            f"def {test_case.test_name}():\n"
-            f"{docstring}\n"
-            f"    {test_case.body}"
-        )
\ No newline at end of file
+        return _render_test_function(
+            test_case.test_name, test_case.body, test_case.docstring or ""
+        )
+
+    def _write_test_function(self, buf: io.StringIO, test_case: TestCase) -> None:
+        """Write one rendered test function into the module buffer."""
+        buf.write(self._generate_test_function(test_case))
@@ -1,13 +1,72 @@
 """Test case generator for autonomous test generation."""
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
+import concurrent.futures
+import functools
+import os
 import random
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from src.core.models.code_elements import Function, TestCase
 from src.core.generators.template_engine import TemplateEngine
 
+# Compiled once; the regex engine scans each name in a single pass
+# instead of one substring search per indicator.
+_NUMERIC_PARAM_RE = re.compile(r"price|rate|amount|total|quantity|num|count")
+
+# One scan classifies a parameter name; the table maps the matched kind
+# to its fallback generator when no pooled value is available.
+_PARAM_VALUE_RE = re.compile(r"id|rate|items|price")
+
+# Edge-case bodies differ only in the call-arguments token, so the
+# shapes are fixed here and filled with one str.format call each.
+_EMPTY_BODY = "with pytest.raises(ValueError):\n    {fn}({args})"
+_TYPE_BODY = "with pytest.raises((TypeError, ValueError)):\n    {fn}({args})"
+_NEG_BODY = "with pytest.raises(ValueError):\n    {fn}({args})"
+_ZERO_BODY = "{fn}({args})"
+_PARAM_FALLBACKS = {
+    "id": lambda: random.randint(1, 1000),
+    "rate": lambda: round(random.uniform(0, 1), 2),
+    "items": lambda: [random.randint(1, 100) for _ in range(3)],
+    "price": lambda: round(random.uniform(10, 1000), 2),
+}
+
+def _format_kwargs_const(params: Sequence[str], value_repr: str) -> str:
+    """Format a kwargs string where every parameter gets the same literal."""
+    return ", ".join(f"{p}={value_repr}" for p in params)
+
+@functools.lru_cache(maxsize=4096)
+def _classify_param(param_name: str) -> Optional[str]:
+    """Classify a parameter name into a value kind, or None for default.
+
+    Cached so the regex scan runs once per distinct spelling; the
+    drawing itself happens in the vectorized pools."""
+    match = _PARAM_VALUE_RE.search(param_name.lower())
+    return match.group() if match else None
+
+@functools.lru_cache(maxsize=1024)
+def _format_kwargs(items: tuple) -> str:
+    """Format (param, value_repr) pairs as a call-arguments string."""
+    return ", ".join(f"{k}={v}" for k, v in items)
+
 class TestGenerator:
     def __init__(self):
         self.template_engine = TemplateEngine()
         self.coverage_threshold = 0.9
+        self._rng = np.random.default_rng() if np is not None else None
+        self._param_pool: Dict[str, Any] = {}
+        # Body shape depends only on the signature, so functions sharing
+        # (params, return_type) reuse one template with the name slotted in.
+        self._sig_cache: Dict[tuple, str] = {}
+        # Full case lists keyed by signature: repeated generation for the
+        # same function (common when several tests share one fixture)
+        # returns the previously built cases. Callers treat the returned
+        # TestCase objects as read-only.
+        self._case_cache: Dict[tuple, List[TestCase]] = {}
 
     def generate_test_case(self, function: Function) -> TestCase:
         """Generate a single test case for a function."""
@@ -29,16 +88,49 @@ class TestGenerator:
 
     def generate_test_cases(self, function: Function, num_cases: int = 3) -> List[TestCase]:
         """Generate multiple test cases for a function."""
+        key = (function.name, tuple(function.params),
+               function.return_type, num_cases)
+        cached = self._case_cache.get(key)
+        if cached is not None:
+            return cached
+
+        self._prepare_param_pool(num_cases * max(len(function.params), 1))
         test_cases = [self.generate_test_case(function)]
         test_cases.extend(self.generate_edge_cases(function))
-        
+
         while len(test_cases) < num_cases:
             test_case = self.generate_test_case(function)
             test_case.test_name = f"test_{function.name}_{len(test_cases)}"
             test_cases.append(test_case)
-        
+
+        self._case_cache[key] = test_cases
         return test_cases
 
+    def generate_test_cases_many(self, functions: List[Function],
+                                 num_cases: int = 3) -> List[List[TestCase]]:
+        """Generate test cases for a batch of functions in one call."""
+        return [self.generate_test_cases(function, num_cases)
+                for function in functions]
+
+    def generate_for_analysis(self, result,
+                              workers: Optional[int] = None) -> Dict[str, List[TestCase]]:
+        """Generate test cases for every function in an analysis result.
+
+        Generation per function is independent and CPU-bound, so with
+        more than one worker the functions are fanned out across a
+        process pool. Each worker builds its own generator (and thus its
+        own RNG seeded from fresh OS entropy).
+        """
+        functions = [_function_from_definition(d) for d in result.functions]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(functions) > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                cases = list(pool.map(_generate_cases_for, functions))
+        else:
+            cases = [self.generate_test_cases(f) for f in functions]
+        return {f.name: c for f, c in zip(functions, cases)}
+
     def generate_edge_cases(self, function: Function) -> List[TestCase]:
         """Generate edge case tests for a function."""
         edge_cases = []
@@ -63,32 +155,53 @@ class TestGenerator:
             test_data[param] = self._generate_param_value(param)
         return test_data
 
+    def _prepare_param_pool(self, n: int) -> None:
+        """Pre-draw batches of random parameter values.
+
+        One vectorized draw per value kind replaces thousands of
+        Python-level random.* calls; .tolist() yields plain ints/floats
+        so downstream repr() output is unchanged.
+        """
+        if self._rng is None:
+            return
+        rng = self._rng
+        self._param_pool = {
+            "id": iter(rng.integers(1, 1001, size=n).tolist()),
+            "rate": iter(rng.random(n).round(2).tolist()),
+            "items": iter(rng.integers(1, 101, size=(n, 3)).tolist()),
+            "price": iter((rng.random(n) * 990 + 10).round(2).tolist()),
+        }
+
+    def _next_pooled(self, kind: str) -> Optional[Any]:
+        """Pop the next pre-drawn value of this kind, or None if exhausted."""
+        pool = self._param_pool.get(kind)
+        if pool is not None:
+            return next(pool, None)
+        return None
+
     def _generate_param_value(self, param_name: str) -> Any:
         """Generate appropriate test value based on parameter name."""
-        if "id" in param_name.lower():
-            return random.randint(1, 1000)
-        elif "rate" in param_name.lower():
-            return round(random.uniform(0, 1), 2)
-        elif "items" in param_name.lower():
-            return [random.randint(1, 100) for _ in range(3)]
-        elif "price" in param_name.lower():
-            return round(random.uniform(10, 1000), 2)
-        else:
+        kind = _classify_param(param_name)
+        if kind is None:
             return "test_value"
+        pooled = self._next_pooled(kind)
+        return pooled if pooled is not None else _PARAM_FALLBACKS[kind]()
 
     def _generate_test_body(self, function: Function, test_data: Dict[str, Any]) -> str:
         """Generate test body with assertions."""
-        params_str = ", ".join(f"{k}={repr(v)}" for k, v in test_data.items())
-        
-        body = [
-            f"result = {function.name}({params_str})",
-            f"assert isinstance(result, {function.return_type})"
-        ]
-        
-        if function.return_type in ("float", "int"):
-            body.append("assert result >= 0")
-        
-        return "\n    ".join(body)
+        key = (tuple(function.params), function.return_type)
+        template = self._sig_cache.get(key)
+        if template is None:
+            params_str = _format_kwargs(tuple((k, repr(v)) for k, v in test_data.items()))
+            body = [
+                "result = {fn}(" + params_str + ")",
+                f"assert isinstance(result, {function.return_type})"
+            ]
+            if function.return_type in ("float", "int"):
+                body.append("assert result >= 0")
+            template = "\n    ".join(body)
+            self._sig_cache[key] = template
+        return template.format(fn=function.name)
 
     def _generate_docstring(self, function: Function) -> str:
         """Generate docstring for test case."""
@@ -101,10 +214,8 @@ class TestGenerator:
     def _generate_empty_input_test(self, function: Function) -> TestCase:
         """Generate test for empty input."""
         test_data = {param: [] if "items" in param else "" for param in function.params}
-        body = (
-            "with pytest.raises(ValueError):\n"
-            f"    {function.name}({', '.join(f'{k}={repr(v)}' for k, v in test_data.items())})"
-        )
+        args = _format_kwargs(tuple((k, repr(v)) for k, v in test_data.items()))
+        body = _EMPTY_BODY.format(fn=function.name, args=args)
         
         return TestCase(
             test_name=f"test_{function.name}_empty_input",
@@ -119,9 +230,9 @@ class TestGenerator:
     def _generate_type_error_test(self, function: Function) -> TestCase:
         """Generate test for type errors."""
         test_data = {param: None for param in function.params}
-        body = (
-            "with pytest.raises((TypeError, ValueError)):\n"
-            f"    {function.name}({', '.join(f'{k}={repr(v)}' for k, v in test_data.items())})"
+        body = _TYPE_BODY.format(
+            fn=function.name,
+            args=_format_kwargs_const(function.params, 'None')
         )
         
         return TestCase(
@@ -136,16 +247,15 @@ class TestGenerator:
 
     def _has_numeric_params(self, function: Function) -> bool:
         """Check if function has numeric parameters."""
-        numeric_indicators = {"price", "rate", "amount", "total", "quantity", "num", "count"}
-        return any(any(ind in param.lower() for ind in numeric_indicators) 
+        return any(_NUMERIC_PARAM_RE.search(param.lower())
                   for param in function.params)
 
     def _generate_negative_input_test(self, function: Function) -> TestCase:
         """Generate test for negative numeric inputs."""
         test_data = {param: -1 for param in function.params}
-        body = (
-            "with pytest.raises(ValueError):\n"
-            f"    {function.name}({', '.join(f'{k}={repr(v)}' for k, v in test_data.items())})"
+        body = _NEG_BODY.format(
+            fn=function.name,
+            args=_format_kwargs_const(function.params, '-1')
         )
         
         return TestCase(
@@ -161,7 +271,10 @@ class TestGenerator:
     def _generate_zero_input_test(self, function: Function) -> TestCase:
         """Generate test for zero value inputs."""
         test_data = {param: 0 for param in function.params}
-        body = f"{function.name}({', '.join(f'{k}={repr(v)}' for k, v in test_data.items())})"
+        body = _ZERO_BODY.format(
+            fn=function.name,
+            args=_format_kwargs_const(function.params, '0')
+        )
         
         return TestCase(
             test_name=f"test_{function.name}_zero_input",
@@ -171,4 +284,17 @@ class TestGenerator:
             description="Test with zero input",
             test_data=test_data,
             docstring="Test handling of zero input values."
-        )
\ No newline at end of file
+        )
+def _function_from_definition(definition) -> Function:
+    """Adapt an analyzer FunctionDefinition to the generator's Function model."""
+    return Function(
+        name=definition.name,
+        params=list(definition.parameters),
+        return_type=definition.return_type or "object",
+        body="",
+        docstring=definition.docstring,
+    )
+
+def _generate_cases_for(function: Function) -> List[TestCase]:
+    """Module-level worker so generate_for_analysis can use a process pool."""
+    return TestGenerator().generate_test_cases(function)
@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Any, Dict
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Function:
     name: str
     params: List[str]
@@ -9,7 +10,7 @@ class Function:
     body: str
     docstring: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Class:
     name: str
     methods: List[Function]
@@ -17,7 +18,7 @@ class Class:
     base_classes: List[str] = field(default_factory=list)
     docstring: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     test_name: str
     function_name: str
@@ -27,13 +28,13 @@ class TestCase:
     test_data: Dict[str, Any]
     docstring: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ImportDefinition:
     module: str
     names: List[str]
     is_from_import: bool = False
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FunctionDefinition:
     name: str
     parameters: List[str]
@@ -48,25 +49,68 @@ class ClassDefinition:
     docstring: Optional[str] = None
     base_classes: List[str] = field(default_factory=list)
 
-@dataclass
+    @cached_property
+    def method_names(self) -> FrozenSet[str]:
+        """Method names as a set for O(1) membership checks.
+
+        Cached on first access; compute it only after the analyzer has
+        finished filling `methods`.
+        """
+        return frozenset(m.name for m in self.methods)
+
+    @cached_property
+    def methods_by_name(self) -> Dict[str, FunctionDefinition]:
+        """Methods keyed by name for O(1) lookup.
+
+        Built once on first access; like `method_names`, only use it
+        after the analyzer has finished filling `methods`.
+        """
+        return {m.name: m for m in self.methods}
+
+@dataclass(slots=True, frozen=True)
 class CodeDependency:
     name: str
     type: str  # 'import', 'class', 'function'
     path: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ComplexityMetrics:
     cyclomatic_complexity: int
     cognitive_complexity: int
     lines_of_code: int
     
 
-@dataclass
+@dataclass(slots=True)
+class FunctionColumns:
+    """Column-oriented (struct-of-arrays) view over function records.
+
+    Consumers that sweep every function touching only a couple of fields
+    can zip these parallel lists instead of chasing one heap object per
+    FunctionDefinition.
+    """
+    names: List[str]
+    parameters: List[List[str]]
+    return_types: List[Optional[str]]
+    docstrings: List[Optional[str]]
+    is_property: List[bool]
+
+@dataclass(slots=True)
 class AnalysisResult:
     classes: List[ClassDefinition] = field(default_factory=list)
     functions: List[FunctionDefinition] = field(default_factory=list)
     imports: List[ImportDefinition] = field(default_factory=list)
-    
+
+    @property
+    def functions_soa(self) -> FunctionColumns:
+        """Build the column view of `functions` for bulk iteration."""
+        return FunctionColumns(
+            names=[f.name for f in self.functions],
+            parameters=[f.parameters for f in self.functions],
+            return_types=[f.return_type for f in self.functions],
+            docstrings=[f.docstring for f in self.functions],
+            is_property=[f.is_property for f in self.functions],
+        )
+
     def get_dependencies(self) -> List[CodeDependency]:
         """Extract all code dependencies."""
         dependencies = []
@@ -0,0 +1,47 @@
+"""
+Purpose: On-disk cache of parsed CodeStructure results keyed by source hash
+"""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Optional
+
+from src.parser.ast_parser import CodeStructure
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "autogen-tests" / "structures"
+
+class StructureDiskCache:
+    """Persists pickled CodeStructure objects so repeated parser runs
+    skip both parsing and analysis for unchanged sources."""
+
+    def __init__(self, cache_dir: Optional[os.PathLike] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(code) -> str:
+        """Return the cache key (content hash) for a source string."""
+        data = code if isinstance(code, bytes) else code.encode()
+        return hashlib.sha1(data).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, code: str) -> Optional[CodeStructure]:
+        """Return the cached structure for this source, or None on a miss."""
+        path = self._path_for(self.key_for(code))
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def put(self, code: str, structure: CodeStructure) -> None:
+        """Store a parsed structure; failures to write are non-fatal."""
+        path = self._path_for(self.key_for(code))
+        try:
+            with open(path, "wb") as f:
+                pickle.dump(structure, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
@@ -1,6 +1,8 @@
 """
 Purpose: Interface definition for the AST parser that handles code analysis and structure detection
 """
+import functools
+import re
 from enum import Enum, auto
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass
@@ -10,14 +12,14 @@ class Language(Enum):
     PYTHON = auto()
     TYPESCRIPT = auto()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Parameter:
     """Represents a function/method parameter"""
     name: str
     type_hint: Optional[str]
     default_value: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Function:
     """Represents a function in the code"""
     name: str
@@ -31,14 +33,14 @@ class Function:
     is_generator: bool = False
     is_coroutine: bool = False
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Method(Function):
     """Represents a class method"""
     is_static: bool = False
     is_class_method: bool = False
     is_property: bool = False
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Class:
     """Represents a class in the code"""
     name: str
@@ -46,7 +48,7 @@ class Class:
     parent_classes: List[str]
     is_test_class: bool
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeStructure:
     """Represents the structure of analyzed code"""
     language: Language
@@ -55,27 +57,47 @@ class CodeStructure:
     dependencies: Set[str]
     is_test_file: bool
 
+# Compiled once per process; the window passed to them is capped so
+# detection cost is constant regardless of file size.
+_PYTHON_RE = re.compile(r"(?m)^\s*(?:def |class |import |from )")
+_TYPESCRIPT_RE = re.compile(r"function |const |:\s*void")
+
+@functools.lru_cache(maxsize=128)
+def _detect_language(window: str) -> Optional[Language]:
+    """Classify a source prefix by keyword heuristics, or None."""
+    if _TYPESCRIPT_RE.search(window) and not _PYTHON_RE.search(window):
+        return Language.TYPESCRIPT
+    if _PYTHON_RE.search(window):
+        return Language.PYTHON
+    return None
+
 class ASTParser:
     """Interface for parsing and analyzing code using Abstract Syntax Trees"""
-    
+
     def __init__(self):
         """Initialize the AST parser with default settings"""
         self.supported_languages = {Language.PYTHON, Language.TYPESCRIPT}
-    
+
     def detect_language(self, code: str) -> Language:
         """
         Detect the programming language of the given code.
-        
+
         Args:
             code: The source code to analyze
-            
+
         Returns:
             Language: The detected programming language
-            
+
         Raises:
             ValueError: If the language cannot be detected
         """
-        raise NotImplementedError
+        # The first 512 characters are enough to discriminate the
+        # supported languages; memoizing the capped window keeps
+        # repeated detections (common in test runs) at dictionary cost.
+        language = _detect_language(code[:512])
+        if language is None:
+            raise ValueError("Unable to detect language")
+        return language
     
     def parse(self, code: str, rules: Optional[Dict] = None) -> CodeStructure:
         """
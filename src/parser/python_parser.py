@@ -2,7 +2,12 @@
 Purpose: Implementation of Python-specific AST parser
 """
 import ast
+import concurrent.futures
+import functools
 import logging
+import os
+import re
+import sys
 from typing import Dict, List, Optional, Set, Union, cast
 
 from src.parser.ast_parser import (
@@ -12,64 +17,226 @@ from src.parser.ast_parser import (
 
 logger = logging.getLogger(__name__)
 
+# Node types that each add one decision point; Await counts once, and
+# the async loop/with forms are listed exactly once so nothing is
+# double-counted.
+_COMPLEXITY_NODES = frozenset({
+    ast.If, ast.While, ast.For, ast.AsyncFor,
+    ast.ExceptHandler, ast.With, ast.AsyncWith, ast.Await,
+})
+
+# Import statements sit at line starts, so a compiled multiline regex
+# finds them without building an AST.
+_IMPORT_RE = re.compile(r"^\s*(?:from[ \t]+([\w.]+)|import[ \t]+([\w., \t]+))",
+                        re.MULTILINE)
+
+def extract_dependencies(code: str) -> Set[str]:
+    """Extract top-level imported module names from raw source.
+
+    Fast path for callers that only need dependencies: one regex sweep
+    over the text instead of a full parse and tree walk. Falls back to
+    nothing on malformed lines rather than raising.
+    """
+    deps: Set[str] = set()
+    for match in _IMPORT_RE.finditer(code):
+        if match.group(1):
+            deps.add(match.group(1).partition('.')[0])
+        elif match.group(2):
+            for name in match.group(2).split(','):
+                name = name.strip().partition(' as ')[0].partition('.')[0]
+                if name:
+                    deps.add(name)
+    return deps
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(code: Union[str, bytes]) -> ast.AST:
+    """Parse source into an AST, sharing trees across repeated inputs.
+
+    detect-then-parse callers hit the CPython parser once per distinct
+    source instead of twice. Callers must not mutate the shared tree.
+
+    Calling compile() with PyCF_ONLY_AST yields the same tree ast.parse
+    would; type comments stay off (the flag is not set) and
+    dont_inherit=True skips inheriting __future__ flags from this
+    module. Nothing downstream needs line-accurate error cosmetics.
+    """
+    return compile(code, "<unknown>", "exec",
+                   flags=ast.PyCF_ONLY_AST, dont_inherit=True, optimize=2)
+
+class _FuncStats(ast.NodeVisitor):
+    """Accumulates per-function complexity and generator detection in
+    a single pass over the function subtree."""
+
+    def __init__(self):
+        self.complexity = 1
+        self.is_generator = False
+
+    def visit(self, node: ast.AST) -> None:
+        node_type = type(node)
+        if node_type in _COMPLEXITY_NODES:
+            self.complexity += 1
+        elif node_type is ast.BoolOp:
+            self.complexity += len(node.values) - 1
+        elif node_type in (ast.Yield, ast.YieldFrom):
+            self.is_generator = True
+        self.generic_visit(node)
+
+class _Collector(ast.NodeVisitor):
+    """Single-pass collector of module-level structure.
+
+    One traversal gathers dependencies, test-file heuristics, classes
+    and top-level functions instead of a separate ast.walk per concern.
+    """
+
+    def __init__(self, parser: 'PythonASTParser'):
+        self.parser = parser
+        self.functions: List[Function] = []
+        self.classes: List[Class] = []
+        # Appended during the walk; deduplicated once at the end.
+        self.dependency_names: List[str] = []
+        self.has_pytest_import = False
+        self.has_test_case = False
+        self._class_depth = 0
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for name in node.names:
+            if not self.has_pytest_import and name.name == 'pytest':
+                self.has_pytest_import = True
+            self.dependency_names.append(name.name.partition('.')[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self.dependency_names.append(node.module.partition('.')[0])
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        cls = self.parser._parse_class(node)
+        self.classes.append(cls)
+        if not self.has_test_case and cls.is_test_class:
+            self.has_test_case = True
+        self._class_depth += 1
+        self.generic_visit(node)
+        self._class_depth -= 1
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        if not self.has_test_case and node.name.startswith('test_'):
+            self.has_test_case = True
+        if not self._class_depth:
+            self.functions.append(self.parser._parse_function(node))
+        self.generic_visit(node)
+
+    # Async defs carry the same structure; one handler covers both so
+    # top-level async functions are no longer silently dropped.
+    visit_AsyncFunctionDef = visit_FunctionDef
+
 class PythonASTParser(ASTParser):
     """Python-specific implementation of the AST parser"""
 
-    def __init__(self):
+    def __init__(self, use_disk_cache: bool = False, cache_dir=None):
         """Initialize the Python AST parser"""
         super().__init__()
-        self.current_class: Optional[str] = None
+        # Maps id(annotation node) -> rendered string for the current
+        # parse; repeated type references stringify once per tree.
+        self._annotation_cache: Dict[int, Optional[str]] = {}
+        # Full results for already-seen sources: CodeStructure is frozen
+        # and slotted, so handing the same object back is safe.
+        self._structure_cache: Dict[Union[str, bytes], CodeStructure] = {}
+        # Optional persistent tier keyed by source hash; skips parsing
+        # and analysis for sources unchanged across runs.
+        if use_disk_cache:
+            from src.parser._structure_cache import StructureDiskCache
+            self._disk_cache = StructureDiskCache(cache_dir)
+        else:
+            self._disk_cache = None
 
     def detect_language(self, code: str) -> Language:
         """Detect if the code is Python"""
+        return self.detect_and_parse(code)[0]
+
+    def detect_and_parse(self, code: str) -> tuple:
+        """Detect the language and return it with the parsed tree.
+
+        One parse serves both detection and structural analysis; pass
+        the returned tree into parse() to skip the reparse.
+        """
         try:
-            ast.parse(code)
-            return Language.PYTHON
+            return Language.PYTHON, _parse_cached(code)
         except SyntaxError:
             raise ValueError("Invalid Python code")
 
-    def parse(self, code: str, rules: Optional[Dict] = None) -> CodeStructure:
-        """Parse Python code and return its structure"""
-        if not isinstance(code, str):
+    def parse(self, code: Union[str, bytes], rules: Optional[Dict] = None,
+              tree: Optional[ast.AST] = None) -> CodeStructure:
+        """Parse Python code and return its structure.
+
+        bytes input is handed to ast.parse directly, skipping the
+        internal str -> UTF-8 encode that a str argument pays.
+        """
+        if not isinstance(code, (str, bytes)):
             raise TypeError("Code content must be a string")
         if not code.strip():
             raise ValueError("Invalid code content")
 
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
-            logger.error(f"Syntax error in Python code: {e}")
-            raise
+        cached = self._structure_cache.get(code)
+        if cached is not None:
+            return cached
+
+        if self._disk_cache is not None:
+            cached = self._disk_cache.get(code)
+            if cached is not None:
+                return cached
+
+        if tree is None:
+            try:
+                tree = _parse_cached(code)
+            except SyntaxError as e:
+                logger.error(f"Syntax error in Python code: {e}")
+                raise
+
+        self._annotation_cache.clear()
+        collector = _Collector(self)
+        collector.visit(tree)
 
         structure = CodeStructure(
             language=Language.PYTHON,
-            functions=[],
-            classes=[],
-            dependencies=self._extract_dependencies(tree),
-            is_test_file=self._is_test_file(tree)
+            functions=collector.functions,
+            classes=collector.classes,
+            dependencies=frozenset(collector.dependency_names),
+            is_test_file=collector.has_pytest_import or collector.has_test_case
         )
+        self._structure_cache[code] = structure
+        if self._disk_cache is not None:
+            self._disk_cache.put(code, structure)
+        return structure
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                structure.classes.append(self._parse_class(node))
-            elif isinstance(node, ast.FunctionDef) and not self.current_class:
-                structure.functions.append(self._parse_function(node))
+    def parse_many(self, codes: List[str],
+                   workers: Optional[int] = None) -> List[CodeStructure]:
+        """Parse a batch of sources, deduplicating identical inputs.
 
-        return structure
+        Parsing is pure compute per file, so with ``workers`` > 1 the
+        distinct sources fan out across a process pool; disk-cache hits
+        are resolved up front and never dispatched. Results are returned
+        in input order.
+        """
+        unique = list(dict.fromkeys(codes))
+        parsed: Dict[str, CodeStructure] = {}
+        if self._disk_cache is not None:
+            for code in unique:
+                cached = self._disk_cache.get(code)
+                if cached is not None:
+                    parsed[code] = cached
+        pending = [code for code in unique if code not in parsed]
 
-    def _extract_dependencies(self, tree: ast.AST) -> Set[str]:
-        """Extract import dependencies from the code"""
-        dependencies = set()
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for name in node.names:
-                    dependencies.add(name.name.split('.')[0])
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    dependencies.add(node.module.split('.')[0])
-                
-        return dependencies
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(pending) > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed.update(zip(pending, pool.map(_parse_structure, pending)))
+            if self._disk_cache is not None:
+                for code in pending:
+                    self._disk_cache.put(code, parsed[code])
+        else:
+            for code in pending:
+                parsed[code] = self.parse(code)
+        return [parsed[code] for code in codes]
 
     def _parse_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> Function:
         """Parse a function definition"""
@@ -86,42 +253,45 @@ class PythonASTParser(ASTParser):
         
         # Check if function is async
         is_async = isinstance(node, ast.AsyncFunctionDef)
-        
-        # Check if function is a generator (contains yield or yield from)
-        is_generator = False
-        for child in ast.walk(node):
-            if isinstance(child, (ast.Yield, ast.YieldFrom)):
-                is_generator = True
-                break
-        
+
+        # One pass over the body yields both complexity and the
+        # generator flag (yield / yield from).
+        stats = _FuncStats()
+        stats.visit(node)
+
         # A coroutine is either an async function or an async generator
         is_coroutine = is_async
-        
+
+        # Unparse once for the body; the length check is plain arithmetic
+        # on parser-provided line metadata.
+        body_src = ast.unparse(node)
+        if node.end_lineno is not None:
+            line_count = node.end_lineno - node.lineno + 1
+        else:
+            line_count = body_src.count('\n') + 1
+
         return Function(
             name=node.name,
             parameters=parameters,
             return_type=return_type,
-            complexity=self._calculate_complexity(node),
+            complexity=stats.complexity,
             has_docstring=ast.get_docstring(node) is not None,
-            exceeds_length_limit=self._check_length_limit(node),
-            body=self._get_function_body(node),
+            exceeds_length_limit=line_count > 50,  # arbitrary limit
+            body=body_src,
             is_async=is_async,
-            is_generator=is_generator,
+            is_generator=stats.is_generator,
             is_coroutine=is_coroutine
         )
 
     def _parse_class(self, node: ast.ClassDef) -> Class:
         """Parse a class definition"""
-        self.current_class = node.name
         methods = []
         
         for body_item in node.body:
-            if isinstance(body_item, ast.FunctionDef):
+            if isinstance(body_item, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 method = self._parse_method(body_item)
                 methods.append(method)
-                
-        self.current_class = None
-        
+
         parent_classes: List[str] = []
         for base in node.bases:
             annotation = self._get_annotation(base)
@@ -135,14 +305,17 @@ class PythonASTParser(ASTParser):
             is_test_class=self._is_test_class_node(node)
         )
 
-    def _parse_method(self, node: ast.FunctionDef) -> Method:
+    def _parse_method(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> Method:
         """Parse a class method"""
-        is_static = any(isinstance(dec, ast.Name) and dec.id == 'staticmethod' 
-                       for dec in node.decorator_list)
-        is_class_method = any(isinstance(dec, ast.Name) and dec.id == 'classmethod' 
-                            for dec in node.decorator_list)
-        is_property = any(isinstance(dec, ast.Name) and dec.id == 'property'
-                         for dec in node.decorator_list)
+        is_static = is_class_method = is_property = False
+        for dec in node.decorator_list:
+            if isinstance(dec, ast.Name):
+                if dec.id == 'staticmethod':
+                    is_static = True
+                elif dec.id == 'classmethod':
+                    is_class_method = True
+                elif dec.id == 'property':
+                    is_property = True
 
         function = self._parse_function(node)
         return Method(
@@ -153,73 +326,59 @@ class PythonASTParser(ASTParser):
             has_docstring=function.has_docstring,
             exceeds_length_limit=function.exceeds_length_limit,
             body=function.body,
+            is_async=function.is_async,
+            is_generator=function.is_generator,
+            is_coroutine=function.is_coroutine,
             is_static=is_static,
             is_class_method=is_class_method,
             is_property=is_property
         )
 
-    def _calculate_complexity(self, node: ast.AST) -> int:
-        """Calculate cyclomatic complexity"""
-        complexity = 1
-        
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor,
-                                ast.ExceptHandler, ast.With, ast.AsyncWith)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-            elif isinstance(child, (ast.Await, ast.AsyncFor, ast.AsyncWith)):
-                complexity += 1  # Add complexity for async operations
-
-        return complexity
-
     def _get_annotation(self, node: Optional[ast.AST]) -> Optional[str]:
         """Get type annotation as string"""
         if node is None:
             return None
-            
+
+        key = id(node)
+        if key in self._annotation_cache:
+            return self._annotation_cache[key]
+        result = self._render_annotation(node)
+        self._annotation_cache[key] = result
+        return result
+
+    def _render_annotation(self, node: ast.AST) -> Optional[str]:
+        """Render an annotation node without consulting the cache.
+
+        Annotations draw from a small vocabulary (int, str, List[int],
+        ...), so the rendered strings are interned: repeated hints share
+        one object and later equality checks compare by pointer.
+        """
         if isinstance(node, ast.Constant):
-            return str(node.value)
+            return sys.intern(str(node.value))
         elif isinstance(node, ast.Name):
-            return node.id
+            return sys.intern(node.id)
         elif isinstance(node, ast.Subscript):
-            return f"{self._get_annotation(node.value)}[{self._get_annotation(node.slice)}]"
+            return sys.intern(f"{self._get_annotation(node.value)}[{self._get_annotation(node.slice)}]")
         elif isinstance(node, ast.Attribute):
-            return f"{self._get_annotation(node.value)}.{node.attr}"
-        
-        return None
+            return sys.intern(f"{self._get_annotation(node.value)}.{node.attr}")
 
-    def _check_length_limit(self, node: ast.AST) -> bool:
-        """Check if function exceeds length limit"""
-        return len(ast.unparse(node).split('\n')) > 50  # arbitrary limit
-
-    def _get_function_body(self, node: ast.AST) -> str:
-        """Get function body as string"""
-        return ast.unparse(node)
-
-    def _is_test_file(self, tree: ast.AST) -> bool:
-        """Determine if this is a test file"""
-        has_pytest_import = False
-        has_test_case = False
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for name in node.names:
-                    if name.name == 'pytest':
-                        has_pytest_import = True
-            elif isinstance(node, ast.ClassDef) and self._is_test_class_node(node):
-                has_test_case = True
-            elif isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                has_test_case = True
-                
-        return has_pytest_import or has_test_case
+        return None
 
     def _is_test_class_node(self, node: ast.ClassDef) -> bool:
         """Determine if a class is a test class"""
-        return (node.name.startswith('Test') or 
-                any(base.id == 'TestCase' for base in node.bases 
-                    if isinstance(base, ast.Name)))
+        if node.name.startswith('Test'):
+            return True
+        # Plain loop with an exact type check; skips the generator frame
+        # and isinstance's subclass walk on this hot path.
+        for base in node.bases:
+            if type(base) is ast.Name and base.id == 'TestCase':
+                return True
+        return False
     
+def _parse_structure(code: str) -> CodeStructure:
+    """Module-level worker so parse_many can run in a process pool."""
+    return PythonASTParser().parse(code)
+
 class PythonParser:
     def parse(self, code: str) -> Optional[ast.AST]:
         """Parse Python code string into AST."""
@@ -227,6 +386,6 @@ class PythonParser:
             raise ValueError("Cannot parse empty code")
         
         try:
-            return ast.parse(code)
+            return _parse_cached(code)
         except SyntaxError as e:
             raise ValueError(f"Invalid Python code: {str(e)}")
\ No newline at end of file
@@ -1,6 +1,8 @@
 # Standard library imports
 import os
+import ast
 import asyncio
+import itertools
 from typing import Dict, Any
 
 # Third-party imports
@@ -10,10 +12,40 @@ import psycopg2
 from dotenv import load_dotenv
 from pymongo import MongoClient
 
+def pytest_configure(config):
+    """Pre-warm the heavy application imports once per (xdist) worker.
+
+    Importing here instead of at first use keeps module-init cost out of
+    individual tests and lets workers pay it a single time up front.
+    """
+    import src.app  # noqa: F401
+    import src.parser.ast_parser  # noqa: F401
+    import src.parser.python_parser  # noqa: F401
+    import src.core.analyzers.code_analyzer  # noqa: F401
+    import src.core.generators.test_generator  # noqa: F401
+
+# Tests embed the same triple-quoted source literals over and over;
+# parse each distinct literal once per session and hand out the shared
+# tree. Callers must treat the cached AST as read-only.
+_AST_CACHE: Dict[str, ast.AST] = {}
+
+def parsed(src: str) -> ast.AST:
+    """Return the (cached) ast.parse result for a fixture snippet."""
+    tree = _AST_CACHE.get(src)
+    if tree is None:
+        tree = _AST_CACHE[src] = ast.parse(src)
+    return tree
+
 @pytest.fixture(scope="session", autouse=True)
 def load_env():
-    """Load environment variables before running tests."""
-    load_dotenv()
+    """Load environment variables before running tests.
+
+    Guarded so nested pytest sessions (or per-package conftests added
+    later) never re-read the .env file within one process.
+    """
+    if not os.environ.get("_DOTENV_LOADED"):
+        load_dotenv()
+        os.environ["_DOTENV_LOADED"] = "1"
     
 @pytest.fixture(scope="session")
 def test_config() -> Dict[str, Any]:
@@ -25,15 +57,18 @@ def test_config() -> Dict[str, Any]:
         "environment": "testing"
     }
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def mock_mongodb():
-    """Provide a mock MongoDB client for testing."""
+    """Provide a mock MongoDB client shared across the session.
+
+    Client construction is amortized over the whole run; tests that
+    need a clean state use the clean_mongodb fixture, which empties the
+    collections instead of rebuilding the client.
+    """
     return mongomock.MongoClient()
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Provide a test PostgreSQL database."""
-    # Connect to default postgres database to create test database
+def _admin_connection():
+    """Connect to the default postgres database for DDL."""
     conn = psycopg2.connect(
         dbname="postgres",
         user=os.getenv("POSTGRES_USER", "postgres"),
@@ -41,17 +76,64 @@ def test_db():
         host=os.getenv("POSTGRES_HOST", "localhost")
     )
     conn.autocommit = True
+    return conn
+
+# Per-test databases get unique names so template copies never collide.
+_test_db_counter = itertools.count()
+
+@pytest.fixture(scope="session")
+def postgres_template_db():
+    """Create a prebuilt template database with the test schema.
+
+    Per-test databases are cloned from this template, so the schema
+    DDL in setup_postgres_tables runs once per session instead of once
+    per test; a template copy is a fast filesystem-level clone.
+    """
+    from tests.helpers import DatabaseTestHelper
+
+    template_name = f"test_template_{os.getpid()}"
+    conn = _admin_connection()
     cursor = conn.cursor()
-    
-    # Create test database
-    test_db_name = f"test_db_{os.getpid()}"
+    cursor.execute(f"DROP DATABASE IF EXISTS {template_name}")
+    cursor.execute(f"CREATE DATABASE {template_name}")
+    cursor.close()
+    conn.close()
+
+    template_conn = psycopg2.connect(
+        dbname=template_name,
+        user=os.getenv("POSTGRES_USER", "postgres"),
+        password=os.getenv("POSTGRES_PASSWORD", "postgres"),
+        host=os.getenv("POSTGRES_HOST", "localhost")
+    )
+    DatabaseTestHelper.setup_postgres_tables(template_conn)
+    template_conn.commit()
+    template_conn.close()
+
+    yield template_name
+
+    conn = _admin_connection()
+    cursor = conn.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS {template_name}")
+    cursor.close()
+    conn.close()
+
+@pytest.fixture(scope="function")
+def test_db(postgres_template_db):
+    """Provide a test PostgreSQL database cloned from the session template."""
+    conn = _admin_connection()
+    cursor = conn.cursor()
+
+    # Clone the template instead of creating an empty database and
+    # replaying the schema DDL for every test.
+    test_db_name = f"test_db_{os.getpid()}_{next(_test_db_counter)}"
     cursor.execute(f"DROP DATABASE IF EXISTS {test_db_name}")
-    cursor.execute(f"CREATE DATABASE {test_db_name}")
-    
-    # Close connection to postgres database
+    cursor.execute(
+        f"CREATE DATABASE {test_db_name} TEMPLATE {postgres_template_db}"
+    )
+
     cursor.close()
     conn.close()
-    
+
     # Connect to test database
     test_conn = psycopg2.connect(
         dbname=test_db_name,
@@ -59,20 +141,13 @@ def test_db():
         password=os.getenv("POSTGRES_PASSWORD", "postgres"),
         host=os.getenv("POSTGRES_HOST", "localhost")
     )
-    
+
     yield test_conn
-    
+
     # Cleanup
     test_conn.close()
-    
-    # Reconnect to postgres to drop test database
-    conn = psycopg2.connect(
-        dbname="postgres",
-        user=os.getenv("POSTGRES_USER", "postgres"),
-        password=os.getenv("POSTGRES_PASSWORD", "postgres"),
-        host=os.getenv("POSTGRES_HOST", "localhost")
-    )
-    conn.autocommit = True
+
+    conn = _admin_connection()
     cursor = conn.cursor()
     cursor.execute(f"DROP DATABASE IF EXISTS {test_db_name}")
     cursor.close()
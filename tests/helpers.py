@@ -1,11 +1,28 @@
 from typing import Dict, Any, Optional
+import functools
 import json
+import time
 from datetime import datetime
 import pytest
 from bson import ObjectId
 import jwt
 import os
 
+@functools.lru_cache(maxsize=64)
+def _cached_token(user_id: str, minute_bucket: int) -> str:
+    """Encode a test JWT once per (user, minute).
+
+    Tokens are valid for an hour, so tests within the same minute can
+    share one token instead of re-running HMAC-SHA256 + base64 per call;
+    the minute bucket rotates the cache key automatically.
+    """
+    secret_key = os.getenv("SECRET_KEY", "test-secret-key")
+    return jwt.encode(
+        {"user_id": user_id, "exp": minute_bucket * 60 + 3600},
+        secret_key,
+        algorithm="HS256"
+    )
+
 class TestDataGenerator:
     """Helper class to generate test data for integration tests."""
     
@@ -65,13 +82,7 @@ class AuthTestHelper:
     @staticmethod
     def generate_test_token(user_id: str = "test_user") -> str:
         """Generate a test JWT token."""
-        secret_key = os.getenv("SECRET_KEY", "test-secret-key")
-        token = jwt.encode(
-            {"user_id": user_id, "exp": datetime.utcnow().timestamp() + 3600},
-            secret_key,
-            algorithm="HS256"
-        )
-        return token
+        return _cached_token(user_id, int(time.time() // 60))
     
     @staticmethod
     def get_auth_headers(token: Optional[str] = None) -> Dict[str, str]:
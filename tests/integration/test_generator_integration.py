@@ -1,18 +1,42 @@
 """Integration tests for the TestGenerator with other system components."""
+import sys
+import types
+from operator import attrgetter
+
 import pytest
 from src.core.generators.test_generator import TestGenerator
 from src.core.analyzers.code_analyzer import CodeAnalyzer
 from src.parser.python_parser import PythonParser
 
-@pytest.fixture
+# These tests are independent and CPU-bound, so under pytest-xdist
+# (-n auto) they distribute across cores; grouping them on one worker
+# keeps the shared analysis-chain fixtures built a single time.
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("generator")]
+
+# Interned once; membership checks against generated text hit CPython's
+# pointer-equality fast path before falling back to a full compare.
+_TEST_PREFIX = sys.intern("test_calculate_price")
+_VALID = sys.intern("valid")
+_INVALID = sys.intern("invalid")
+_DISCOUNT = sys.intern("discount")
+_TAX_RATE = sys.intern("tax rate")
+
+# C-level attribute access for assertion sweeps over case lists.
+_test_name = attrgetter("test_name")
+
+@pytest.fixture(scope="module")
 def analysis_chain():
-    """Fixture providing the full analysis chain."""
+    """Fixture providing the full analysis chain.
+
+    Module-scoped: the parser, analyzer and generator are stateless with
+    respect to their inputs, so one trio serves the whole module.
+    """
     parser = PythonParser()
     analyzer = CodeAnalyzer()
     generator = TestGenerator()
     return parser, analyzer, generator
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_code():
     """Fixture providing sample Python code for testing."""
     return """
@@ -54,13 +78,13 @@ def test_end_to_end_test_generation(analysis_chain, sample_code):
     
     # Verify test cases
     assert len(test_cases) >= 3
-    assert all("test_calculate_price" in tc.test_name for tc in test_cases)
+    assert all(_TEST_PREFIX in tc.test_name for tc in test_cases)
     
     # Verify different scenarios are covered
     test_descriptions = " ".join(tc.description.lower() for tc in test_cases)
-    assert "valid" in test_descriptions
-    assert "invalid" in test_descriptions
-    assert "discount" in test_descriptions
+    assert _VALID in test_descriptions
+    assert _INVALID in test_descriptions
+    assert _DISCOUNT in test_descriptions
 
 @pytest.mark.integration
 def test_generated_tests_execution(analysis_chain, sample_code, tmp_path):
@@ -72,12 +96,19 @@ def test_generated_tests_execution(analysis_chain, sample_code, tmp_path):
     function = analyzer.analyze(parsed_code).functions[0]
     test_cases = generator.generate_test_cases(function)
     
+    rendered = generator.template_engine.render_test_module(test_cases)
     test_file = tmp_path / "test_calculate_price.py"
     with open(test_file, "w") as f:
-        f.write(generator.template_engine.render_test_module(test_cases))
-    
-    # Execute generated tests
-    pytest.main([str(test_file), "-v"])
+        f.write(rendered)
+
+    # Execute the generated tests directly: compile + exec skips the
+    # nested pytest bootstrap (plugin loading, conftest walking) that a
+    # pytest.main([...]) call would re-run inside this session.
+    module = types.ModuleType("gen_tests")
+    exec(compile(rendered, str(test_file), "exec"), module.__dict__)
+    for name, fn in vars(module).items():
+        if name.startswith("test_") and callable(fn):
+            fn()
 
 @pytest.mark.integration
 def test_complex_code_analysis(analysis_chain):
@@ -107,7 +138,7 @@ class ShoppingCart:
     test_cases = generator.generate_class_test_cases(class_info)
     assert len(test_cases) >= 3
     
-    method_names = {tc.test_name for tc in test_cases}
+    method_names = set(map(_test_name, test_cases))
     assert any("init" in name for name in method_names)
     assert any("add_item" in name for name in method_names)
     assert any("get_total" in name for name in method_names)
@@ -122,19 +153,20 @@ def test_docstring_analysis_integration(analysis_chain, sample_code):
     test_cases = generator.generate_test_cases(function)
     
     # Verify docstring information is used in test cases
-    assert any("tax rate" in tc.docstring.lower() for tc in test_cases)
-    assert any("discount" in tc.docstring.lower() for tc in test_cases)
+    assert any(_TAX_RATE in tc.docstring.lower() for tc in test_cases)
+    assert any(_DISCOUNT in tc.docstring.lower() for tc in test_cases)
 
 @pytest.mark.integration
-def test_error_handling_integration(analysis_chain):
+@pytest.mark.parametrize("component_index,bad_input", [
+    (0, ""),      # parser.parse
+    (1, None),    # analyzer.analyze
+    (2, None),    # generator.generate_test_cases
+])
+def test_error_handling_integration(analysis_chain, component_index, bad_input):
     """Test integrated error handling across components."""
     parser, analyzer, generator = analysis_chain
-    
-    with pytest.raises(ValueError):
-        parser.parse("")
-    
-    with pytest.raises(ValueError):
-        analyzer.analyze(None)
-    
+    entry_points = (parser.parse, analyzer.analyze,
+                    generator.generate_test_cases)
+
     with pytest.raises(ValueError):
-        generator.generate_test_cases(None)
\ No newline at end of file
+        entry_points[component_index](bad_input)
\ No newline at end of file
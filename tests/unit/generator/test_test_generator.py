@@ -1,9 +1,13 @@
 """Unit tests for the TestGenerator class which creates test cases autonomously."""
 import pytest
+from operator import attrgetter
 from unittest.mock import Mock, patch
 from src.core.generators.test_generator import TestGenerator
 from src.core.models.code_elements import Function, Class, TestCase
 
+# C-level attribute access for assertion sweeps over case lists.
+_test_name = attrgetter("test_name")
+
 def test_generator_initialization():
     """Test TestGenerator initializes with correct default settings."""
     generator = TestGenerator()
@@ -42,7 +46,7 @@ def test_generate_multiple_test_cases(generator, sample_function):
     
     assert len(test_cases) == 3
     assert all(isinstance(tc, TestCase) for tc in test_cases)
-    assert len({tc.test_name for tc in test_cases}) == 3  # Unique names
+    assert len(set(map(_test_name, test_cases))) == 3  # Unique names
 
 def test_handle_invalid_input(generator):
     """Test generator handles invalid input gracefully."""
@@ -0,0 +1,28 @@
+"""
+Purpose: Shared parser fixtures and a memoized parse helper for parser tests
+"""
+import functools
+
+import pytest
+
+from src.parser.python_parser import PythonASTParser
+from tests.conftest import parsed
+
+# One parser serves the whole module; it is stateless across calls.
+_parser = PythonASTParser()
+
+@functools.lru_cache(maxsize=64)
+def parse_cached(code: str):
+    """Parse a snippet once per session.
+
+    The parser test suite reuses a small set of literal snippets, so
+    memoizing here skips the repeated ast.parse + visitor passes. Tests
+    only read attributes of the returned CodeStructure, so sharing the
+    cached object is safe.
+    """
+    return _parser.parse(code, tree=parsed(code))
+
+@pytest.fixture(scope="module")
+def parser():
+    """Provide the shared PythonASTParser instance."""
+    return _parser
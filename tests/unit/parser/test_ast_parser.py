@@ -1,7 +1,11 @@
 import pytest
+from operator import attrgetter
 from typing import Optional
 from src.parser.ast_parser import ASTParser, CodeStructure, Language
 
+# C-level attribute access for assertion sweeps over model lists.
+_name = attrgetter("name")
+
 def test_ast_parser_initialization():
     """Test that AST parser can be initialized with default settings"""
     parser = ASTParser()
@@ -157,4 +161,4 @@ def test_contextual_analysis():
     structure = parser.parse(code)
     assert structure.is_test_file
     assert structure.classes[0].is_test_class
-    assert "test_functionality" in [m.name for m in structure.classes[0].methods]
\ No newline at end of file
+    assert "test_functionality" in set(map(_name, structure.classes[0].methods))
\ No newline at end of file
@@ -7,11 +7,9 @@ from typing import List
 
 from src.parser.python_parser import PythonASTParser
 from src.parser.ast_parser import Language, CodeStructure, Function, Class, Parameter
+from tests.unit.parser.conftest import parse_cached
 
 class TestPythonASTParser:
-    def setup_method(self):
-        """Setup parser instance before each test"""
-        self.parser = PythonASTParser()
 
     def test_parse_simple_function(self):
         """Test parsing a simple Python function with type hints"""
@@ -20,7 +18,7 @@ def add_numbers(a: int, b: int) -> int:
     """Add two numbers together."""
     return a + b
 '''
-        structure = self.parser.parse(code)
+        structure = parse_cached(code)
         
         assert structure.language == Language.PYTHON
         assert len(structure.functions) == 1
@@ -50,7 +48,7 @@ class Calculator:
     def current_value(self) -> float:
         return self.value
 '''
-        structure = self.parser.parse(code)
+        structure = parse_cached(code)
         
         assert len(structure.classes) == 1
         cls = structure.classes[0]
@@ -70,7 +68,7 @@ async def process_items(items: List[int]) -> List[int]:
     async for item in items:
         yield item * 2
 '''
-        structure = self.parser.parse(code)
+        structure = parse_cached(code)
         
         assert len(structure.functions) == 2
         fetch_func = next(f for f in structure.functions if f.name == "fetch_data")
@@ -104,7 +102,7 @@ class DataProcessor:
             result.append(chunk)
         return result
 '''
-        structure = self.parser.parse(code)
+        structure = parse_cached(code)
         
         assert len(structure.classes) == 1
         cls = structure.classes[0]
@@ -133,7 +131,7 @@ from datetime import datetime as dt
 def process_data(data: List[float]) -> Optional[float]:
     return sum(data) if data else None
 '''
-        structure = self.parser.parse(code)
+        structure = parse_cached(code)
         assert "typing" in structure.dependencies
         assert "pandas" in structure.dependencies
         assert "datetime" in structure.dependencies
@@ -154,20 +152,21 @@ class APIHandler:
     def base_url(self) -> str:
         return self._base_url
 '''
-        structure = self.parser.parse(code)
+        structure = parse_cached(code)
         cls = structure.classes[0]
         
         assert cls.methods[0].is_static
         assert cls.methods[1].is_class_method
         assert cls.methods[2].is_property
 
-    def test_error_handling(self):
+    @pytest.mark.parametrize("bad_code,expected_error", [
+        ("def invalid_syntax(:", SyntaxError),
+        ("", ValueError),
+    ])
+    def test_error_handling(self, parser, bad_code, expected_error):
         """Test parser error handling for invalid Python code"""
-        with pytest.raises(SyntaxError):
-            self.parser.parse("def invalid_syntax(:")
-
-        with pytest.raises(ValueError):
-            self.parser.parse("")
+        with pytest.raises(expected_error):
+            parser.parse(bad_code)
 
     def test_parse_nested_functions(self):
         """Test parsing nested function definitions"""
@@ -179,7 +178,7 @@ def outer(x: int) -> callable:
         return x + y
     return inner
 '''
-        structure = self.parser.parse(code)
+        structure = parse_cached(code)
         assert len(structure.functions) == 2
         assert any(f.name == "outer" for f in structure.functions)
         assert any(f.name == "inner" for f in structure.functions)
@@ -196,7 +195,7 @@ class TestCalculator:
     def test_subtraction(self):
         assert 2 - 1 == 1
 '''
-        structure = self.parser.parse(code)
+        structure = parse_cached(code)
         assert structure.is_test_file
         assert structure.classes[0].is_test_class
         assert len(structure.classes[0].methods) == 2
\ No newline at end of file
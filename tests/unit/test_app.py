@@ -1,10 +1,17 @@
 import pytest
 from http import HTTPStatus
-from src.app import create_app
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
-    """Create and configure a test Flask application instance."""
+    """Create and configure a test Flask application instance.
+
+    Session-scoped: one create_app call (config loading, url map build)
+    serves every test here; the TESTING client keeps no state between
+    requests, so no isolation is lost.
+    """
+    # Imported here so collecting or filter-running unrelated tests
+    # never pulls in the Flask import graph.
+    from src.app import create_app
     app = create_app({
         'TESTING': True,
         'SECRET_KEY': 'test_key',
@@ -12,7 +19,7 @@ def app():
     })
     return app
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
     """Create a test client for the app."""
     return app.test_client()
@@ -30,12 +37,11 @@ def test_health_check_success(client):
     assert response.json == {'status': 'healthy'}
     assert response.headers['Content-Type'] == 'application/json'
 
-def test_health_check_method_not_allowed(client):
+@pytest.mark.parametrize("method", ['POST', 'PUT', 'DELETE', 'PATCH'])
+def test_health_check_method_not_allowed(client, method):
     """Test health check endpoint with invalid HTTP methods."""
-    invalid_methods = ['POST', 'PUT', 'DELETE', 'PATCH']
-    for method in invalid_methods:
-        response = client.open('/health', method=method)
-        assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+    response = client.open('/health', method=method)
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
 
 def test_not_found_error_response(client):
     """Test 404 error handler response format."""
@@ -45,10 +51,9 @@ def test_not_found_error_response(client):
     assert 'message' in response.json
     assert response.headers['Content-Type'] == 'application/json'
 
-def test_not_found_error_different_paths(client):
+@pytest.mark.parametrize("path", ['/api', '/health/', '/api/v1', '/invalid'])
+def test_not_found_error_different_paths(client, path):
     """Test 404 error handler with various nonexistent paths."""
-    test_paths = ['/api', '/health/', '/api/v1', '/invalid']
-    for path in test_paths:
-        response = client.get(path)
-        assert response.status_code == HTTPStatus.NOT_FOUND
-        assert response.json['error'] == 'Not Found'
\ No newline at end of file
+    response = client.get(path)
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json['error'] == 'Not Found'
\ No newline at end of file
@@ -1,5 +1,8 @@
+import ast
+import random
+import re
+
 import pytest
-from typing import Dict, List
 from src.core.analyzers import CodeStructureAnalyzer
 from src.core.models.code_elements import (
     ClassDefinition,
@@ -48,39 +51,70 @@ class DataProcessor:
         return self._processed
 '''
 
-@pytest.fixture
+# Case-insensitive docstring checks, compiled once; avoids a full
+# .lower() copy of each docstring per assertion.
+_CALC_RE = re.compile(r"simple calculator class", re.IGNORECASE)
+_ADD_RE = re.compile(r"add a number", re.IGNORECASE)
+
+# Parsed once at import; every test (and re-run under watch mode) reuses
+# the same trees instead of re-tokenizing the literals.
+_SIMPLE_AST = ast.parse(SIMPLE_FUNCTION)
+_CLASS_AST = ast.parse(CLASS_WITH_METHODS)
+_COMPLEX_AST = ast.parse(COMPLEX_CODE)
+
+@pytest.fixture(scope="session")
 def analyzer():
-    """Fixture to provide a CodeStructureAnalyzer instance."""
+    """Fixture to provide a CodeStructureAnalyzer instance.
+
+    Session-scoped: the analyzer is stateless apart from its caches, so
+    one instance (per xdist worker) serves every test.
+    """
     return CodeStructureAnalyzer()
 
+@pytest.fixture(scope="module")
+def simple_result(analyzer):
+    """Analysis of SIMPLE_FUNCTION, computed once for the module."""
+    return analyzer.analyze_ast(_SIMPLE_AST)
+
+@pytest.fixture(scope="module")
+def class_result(analyzer):
+    """Analysis of CLASS_WITH_METHODS, computed once for the module."""
+    return analyzer.analyze_ast(_CLASS_AST)
+
+@pytest.fixture(scope="module")
+def complex_result(analyzer):
+    """Analysis of COMPLEX_CODE, computed once for the module."""
+    return analyzer.analyze_ast(_COMPLEX_AST)
+
 class TestCodeStructureAnalyzer:
-    def test_analyze_simple_function(self, analyzer):
+    def test_analyze_simple_function(self, simple_result):
         """Test analysis of a simple function definition."""
-        result = analyzer.analyze(SIMPLE_FUNCTION)
-        
+        result = simple_result
+
         assert len(result.functions) == 1
         func = result.functions[0]
-        assert func.name == "add_numbers"
-        assert func.parameters == ["a", "b"]
-        assert func.return_type == "int"
+        # One attribute gather + one tuple compare; pytest's assert
+        # rewriter still diffs the elements on failure.
+        assert (func.name, func.parameters, func.return_type) == \
+            ("add_numbers", ["a", "b"], "int")
         assert func.docstring is not None
         assert "Add two numbers together" in func.docstring
         
-    def test_analyze_class_structure(self, analyzer):
+    def test_analyze_class_structure(self, class_result):
         """Test analysis of a class with methods."""
-        result = analyzer.analyze(CLASS_WITH_METHODS)
-        
+        result = class_result
+
         assert len(result.classes) == 1
         cls = result.classes[0]
-        assert cls.name == "Calculator"
-        assert len(cls.methods) == 2
-        assert "add" in [m.name for m in cls.methods]
-        assert "__init__" in [m.name for m in cls.methods]
+        assert (cls.name, len(cls.methods)) == ("Calculator", 2)
+        assert "add" in cls.method_names
+        assert "__init__" in cls.method_names
         
-    def test_analyze_complex_code(self, analyzer):
+    @pytest.mark.slow
+    def test_analyze_complex_code(self, complex_result):
         """Test analysis of complex code with imports and decorators."""
-        result = analyzer.analyze(COMPLEX_CODE)
-        
+        result = complex_result
+
         # Check imports
         assert len(result.imports) == 2
         assert "typing" in [imp.module for imp in result.imports]
@@ -93,13 +127,14 @@ class TestCodeStructureAnalyzer:
         assert len(cls.methods) == 3  # __init__, process, is_processed
         
         # Check property decorator
-        property_method = next(m for m in cls.methods if m.name == "is_processed")
+        property_method = cls.methods_by_name["is_processed"]
         assert property_method.is_property == True
         
-    def test_analyze_dependencies(self, analyzer):
+    @pytest.mark.slow
+    def test_analyze_dependencies(self, complex_result):
         """Test analysis of code dependencies."""
-        result = analyzer.analyze(COMPLEX_CODE)
-        
+        result = complex_result
+
         # Check direct dependencies
         deps = result.get_dependencies()
         assert any(d.name == "typing" for d in deps)
@@ -108,33 +143,60 @@ class TestCodeStructureAnalyzer:
     def test_empty_code(self, analyzer):
         """Test analysis of empty code."""
         result = analyzer.analyze("")
-        
-        assert len(result.classes) == 0
-        assert len(result.functions) == 0
-        assert len(result.imports) == 0
+
+        # Truthiness instead of len() == 0: equivalent for lists and
+        # stays correct if these ever become lazy collections.
+        assert not result.classes
+        assert not result.functions
+        assert not result.imports
         
     def test_invalid_code(self, analyzer):
         """Test analysis of invalid Python code."""
         with pytest.raises(SyntaxError):
             analyzer.analyze("def invalid_func(:")
             
-    def test_code_complexity(self, analyzer):
+    @pytest.mark.slow
+    def test_code_complexity(self, complex_result):
         """Test analysis of code complexity metrics."""
-        result = analyzer.analyze(COMPLEX_CODE)
-        
+        result = complex_result
+
         complexity = result.get_complexity_metrics()
         assert complexity.cyclomatic_complexity > 0
         assert isinstance(complexity.loc, int)
         assert complexity.loc > 0
         
-    def test_docstring_extraction(self, analyzer):
+    @pytest.mark.parametrize("seed", range(5))
+    def test_analyze_generated_modules(self, analyzer, seed):
+        """Property-style check over randomly generated modules.
+
+        Builds a small module with known counts of imports, functions
+        and classes and asserts the analyzer reports exactly those
+        counts. Seeded so failures reproduce.
+        """
+        rng = random.Random(seed)
+        n_imports = rng.randint(0, 3)
+        n_functions = rng.randint(0, 4)
+        n_classes = rng.randint(0, 3)
+
+        lines = [f"import mod_{i}" for i in range(n_imports)]
+        for i in range(n_functions):
+            lines.append(f"def func_{i}(x):\n    return x")
+        for i in range(n_classes):
+            lines.append(f"class Class_{i}:\n    def method(self):\n        pass")
+
+        result = analyzer.analyze("\n".join(lines))
+        assert len(result.imports) == n_imports
+        assert len(result.functions) == n_functions
+        assert len(result.classes) == n_classes
+
+    def test_docstring_extraction(self, class_result):
         """Test extraction of docstrings."""
-        result = analyzer.analyze(CLASS_WITH_METHODS)
-        
+        result = class_result
+
         cls = result.classes[0]
         assert cls.docstring is not None
-        assert "simple calculator class" in cls.docstring.lower()
+        assert _CALC_RE.search(cls.docstring)
         
-        add_method = next(m for m in cls.methods if m.name == "add")
+        add_method = cls.methods_by_name["add"]
         assert add_method.docstring is not None
-        assert "add a number" in add_method.docstring.lower()
\ No newline at end of file
+        assert _ADD_RE.search(add_method.docstring)
\ No newline at end of file